@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import re
 from copy import copy
@@ -12,6 +11,7 @@ from whatsapp.data import WhatsappMediaData
 from whatsapp_matrix.config import Config
 
 from .types import WhatsappMediaID, WhatsappMessageID, WhatsappPhone, WsBusinessID, WSPhoneID
+from .util import json_loads
 
 
 class WhatsappClient:
@@ -126,10 +126,10 @@ class WhatsappClient:
         self.log.debug(f"Sending message {data} to {phone_id}")
         # Send the message to the Whatsapp API
         resp = await self.http.post(send_message_url, json=data, headers=headers)
-        response_data = json.loads(await resp.text())
+        response_data = json_loads(await resp.read())
 
         # If the message was not sent, raise an error
-        if response_data.get("error", {}):
+        if response_data.get("error"):
             raise ValueError(response_data)
 
         return response_data
@@ -199,10 +199,10 @@ class WhatsappClient:
 
         # Send the message to the Whatsapp API
         resp = await self.http.post(send_message_url, json=data, headers=headers)
-        response_data = json.loads(await resp.text())
+        response_data = json_loads(await resp.read())
 
         # If the message was not sent, raise an error
-        if response_data.get("error", {}):
+        if response_data.get("error"):
             raise ValueError(response_data)
 
         return response_data
@@ -239,10 +239,10 @@ class WhatsappClient:
             self.log.error(e)
             return None
 
-        self.log.debug(f"Getting data of media from {await resp.json()}")
-        data = await resp.json()
+        data = await resp.json(loads=json_loads)
+        self.log.debug(f"Getting data of media from {data}")
 
-        if data.get("error", {}):
+        if data.get("error"):
             self.log.error(f"Error getting the data of the media: {data.get('error')}")
             return None
 
@@ -288,10 +288,10 @@ class WhatsappClient:
 
         # Send the read event to the Whatsapp API
         resp = await self.http.post(mark_read_url, data=data, headers=headers)
-        response_data = json.loads(await resp.text())
+        response_data = json_loads(await resp.read())
 
         # If the read event was not sent, raise an error
-        if response_data.get("error", {}):
+        if response_data.get("error"):
             raise AttributeError(response_data)
 
         return response_data
@@ -342,10 +342,10 @@ class WhatsappClient:
 
         # Send the reaction to the Whatsapp API
         resp = await self.http.post(send_message_url, json=data, headers=headers)
-        response_data = json.loads(await resp.text())
+        response_data = json_loads(await resp.read())
 
         # If the message was not sent, raise an error
-        if response_data.get("error", {}):
+        if response_data.get("error"):
             raise FileNotFoundError(response_data)
 
         return response_data
@@ -452,10 +452,10 @@ class WhatsappClient:
         resp = await self.http.post(send_template_url, json=data, headers=headers)
 
         if resp.status not in (200, 201):
-            message = await resp.json()
+            message = await resp.json(loads=json_loads)
             raise Exception(message.get("error", {}).get("message", ""))
 
-        return await resp.json()
+        return await resp.json(loads=json_loads)
 
     async def get_template_message(
         self,
@@ -500,10 +500,10 @@ class WhatsappClient:
         response: ClientSession = await self.http.get(url=url, headers=headers, params=params)
 
         if response.status != 200:
-            error = await response.json()
+            error = await response.json(loads=json_loads)
             raise Exception(error.get("error", {}).get("message"))
 
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         templates = data.get("data", [])
 
         return self.search_and_get_template_message(
@@ -553,7 +553,7 @@ class WhatsappClient:
             upload_media_url, data=form_data, headers=headers
         )
 
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         return data
 
     def search_and_get_template_message(
@@ -591,7 +591,7 @@ class WhatsappClient:
         for template in templates:
             # Search the template with the name of the template_name to save it in a text message
             if template.get("name") == template_name:
-                for component in template.get("components", []):
+                for component in template.get("components") or ():
                     has_variables = re.findall(r'\{\{\d+\}\}', component.get("text", ""))
                     if component.get("type") == "HEADER":
                         if not header_variables and has_variables:
@@ -644,8 +644,7 @@ class WhatsappClient:
                         variables = []
                         if button_variables:
                             variables = copy(button_variables)
-                        for i in range(len(component.get("buttons", []))):
-                            button = component.get("buttons", [])[i]
+                        for i, button in enumerate(component.get("buttons") or ()):
                             has_button_variables = re.findall(r'\{\{\d+\}\}', button.get("url", ""))
                             # If the template has a url button, validate if the button has a variable or not
                             if button.get("type") == "URL":
@@ -1,11 +1,13 @@
+from typing import Optional
+
 from attr import dataclass, ib
 from mautrix.types import SerializableAttrs
 
 from .types import WhatsappMessageID, WhatsappPhone, WsBusinessID, WSPhoneID
 
 
-@dataclass
-class ListReply(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class ListReply:
     """
     Contains the information from the rows of the sections list.
 
@@ -21,8 +23,8 @@ class ListReply(SerializableAttrs):
     description: str = ib(metadata={"json": "description"}, default="")
 
 
-@dataclass
-class ButtonReply(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class ButtonReply:
     """
     Contains the id and the text of the button
 
@@ -36,8 +38,8 @@ class ButtonReply(SerializableAttrs):
     title: str = ib(metadata={"json": "title"}, default="")
 
 
-@dataclass
-class ButtonMessage(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class ButtonMessage:
     """
     Contains the information of the button message.
 
@@ -55,8 +57,8 @@ class ButtonMessage(SerializableAttrs):
             text=data.get("text", ""),
         )
 
-@dataclass
-class InteractiveMessage(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class InteractiveMessage:
     """
     Contains the response from the user who interacted with the interactive message.
 
@@ -66,15 +68,30 @@ class InteractiveMessage(SerializableAttrs):
     """
 
     type: str = ib(metadata={"json": "type"}, default="")
-    button_reply: ButtonReply = ib(metadata={"json": "button_reply"}, default={})
-    list_reply: ListReply = ib(metadata={"json": "list_reply"}, default={})
+    button_reply: Optional[ButtonReply] = ib(metadata={"json": "button_reply"}, default=None)
+    list_reply: Optional[ListReply] = ib(metadata={"json": "list_reply"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
+        button_reply_obj = None
+        list_reply_obj = None
+
+        # Only the reply of the type of the message is sent
+        if button_reply := data.get("button_reply"):
+            button_reply_obj = ButtonReply(
+                id=button_reply.get("id", ""), title=button_reply.get("title", "")
+            )
+        elif list_reply := data.get("list_reply"):
+            list_reply_obj = ListReply(
+                id=list_reply.get("id", ""),
+                title=list_reply.get("title", ""),
+                description=list_reply.get("description", ""),
+            )
+
         return cls(
             type=data.get("type", ""),
-            button_reply=ButtonReply(**data.get("button_reply", {})),
-            list_reply=ListReply(**data.get("list_reply", {})),
+            button_reply=button_reply_obj,
+            list_reply=list_reply_obj,
         )
 
     @property
@@ -85,8 +102,8 @@ class InteractiveMessage(SerializableAttrs):
         return msg
 
 
-@dataclass
-class WhatsappReaction(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappReaction:
     """
     Contain the information of the reaction.
 
@@ -99,8 +116,8 @@ class WhatsappReaction(SerializableAttrs):
     emoji: str = ib(metadata={"json": "emoji"}, default="")
 
 
-@dataclass
-class WhatsappLocation(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappLocation:
     """
     Contain the location of the customer.
 
@@ -122,8 +139,14 @@ class WhatsappLocation(SerializableAttrs):
     url: str = ib(metadata={"json": "url"}, default="")
 
 
-@dataclass
-class WhatsappDocument(SerializableAttrs):
+# Shared instances used when a message does not carry a location or a reaction, so that we don't
+# build an empty object for every message. They are shared, which their frozen classes make safe.
+_EMPTY_LOCATION = WhatsappLocation()
+_EMPTY_REACTION = WhatsappReaction()
+
+
+@dataclass(slots=True, frozen=True)
+class WhatsappDocument:
     """
     Contain the document of the customer.
 
@@ -139,7 +162,7 @@ class WhatsappDocument(SerializableAttrs):
     id: str = ib(metadata={"json": "id"}, default="")
     hash: str = ib(metadata={"json": "sha256"}, default="")
     mime_type: str = ib(metadata={"json": "mime_type"}, default="")
-    filename: str = ib(metadata={"json": "filename"}, default=False)
+    filename: str = ib(metadata={"json": "filename"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -151,8 +174,8 @@ class WhatsappDocument(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappSticker(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappSticker:
     """
     Contain the sticker of the customer.
 
@@ -168,7 +191,7 @@ class WhatsappSticker(SerializableAttrs):
     id: str = ib(metadata={"json": "id"}, default="")
     hash: str = ib(metadata={"json": "sha256"}, default="")
     mime_type: str = ib(metadata={"json": "mime_type"}, default="")
-    animated: bool = ib(metadata={"json": "voice"}, default=False)
+    animated: bool = ib(metadata={"json": "animated"}, default=False)
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -180,8 +203,8 @@ class WhatsappSticker(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappAudio(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappAudio:
     """
     Contain the audio of the customer.
 
@@ -209,41 +232,16 @@ class WhatsappAudio(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappVideo(SerializableAttrs):
-    """
-    Contain the video of the customer.
-
-    - id: The id of the video.
-
-    - hash: The hash of the video.
-
-    - mime_type: The type of the video.
+@dataclass(slots=True, frozen=True)
+class WhatsappMedia:
     """
+    Contain the image or the video of the customer, both arrive with the same fields.
 
-    id: str = ib(metadata={"json": "id"}, default="")
-    hash: str = ib(metadata={"json": "sha256"}, default="")
-    mime_type: str = ib(metadata={"json": "mime_type"}, default="")
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        return cls(
-            id=data.get("id", ""),
-            hash=data.get("sha256", ""),
-            mime_type=data.get("mime_type", ""),
-        )
-
-
-@dataclass
-class WhatsappImage(SerializableAttrs):
-    """
-    Contain the image of the customer.
-
-    - id: The id of the image.
+    - id: The id of the media.
 
-    - hash: The hash of the image.
+    - hash: The hash of the media.
 
-    - mime_type: The type of the image.
+    - mime_type: The type of the media.
     """
 
     id: str = ib(metadata={"json": "id"}, default="")
@@ -259,28 +257,8 @@ class WhatsappImage(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappText(SerializableAttrs):
-    """
-    Contain the message of the customer.
-    """
-
-    body: str = ib(metadata={"json": "body"}, default="")
-
-
-@dataclass
-class WhatsappErrorData(SerializableAttrs):
-    """
-    Contain the details of the error.
-
-    - details: A message with the details of the error.
-    """
-
-    details: str = ib(metadata={"json": "details"}, default="")
-
-
-@dataclass
-class WhatsappErrors(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappErrors:
     """
     Contain de information of the error.
 
@@ -290,40 +268,28 @@ class WhatsappErrors(SerializableAttrs):
 
     - message: The message of the error.
 
-    - error_data: The data of the error.
+    - details: The details of the error, sent by whatsapp as error_data.details.
     """
 
-    code: str = ib(metadata={"json": "code"}, default="")
-    title: str = ib(metadata={"json": "title"}, default="")
-    message: str = ib(metadata={"json": "message"}, default="")
-    error_data: WhatsappErrorData = ib(metadata={"json": "error_data"}, default={})
+    code: Optional[str] = ib(metadata={"json": "code"}, default=None)
+    title: Optional[str] = ib(metadata={"json": "title"}, default=None)
+    message: Optional[str] = ib(metadata={"json": "message"}, default=None)
+    details: str = ib(metadata={"json": "error_data"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
-        code_obj = None
-        title_obj = None
-        message_obj = None
-        error_data_obj = None
-
-        if data.get("code"):
-            code_obj = data.get("code", "")
-        if data.get("title"):
-            title_obj = data.get("title", "")
-        if data.get("message"):
-            message_obj = data.get("message", "")
-        if data.get("error_data"):
-            error_data_obj = WhatsappErrorData(**data.get("error_data", {}))
+        error_data = data.get("error_data")
 
         return cls(
-            code=code_obj,
-            title=title_obj,
-            message=message_obj,
-            error_data=error_data_obj,
+            code=data.get("code") or None,
+            title=data.get("title") or None,
+            message=data.get("message") or None,
+            details=error_data.get("details", "") if error_data else "",
         )
 
 
-@dataclass
-class WhatsappStatusesEvent(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappStatusesEvent:
     """
     Contain the information of the error status.
 
@@ -342,16 +308,12 @@ class WhatsappStatusesEvent(SerializableAttrs):
     status: str = ib(metadata={"json": "status"}, default="")
     timestamp: str = ib(metadata={"json": "timestamp"}, default="")
     recipient_id: str = ib(metadata={"json": "recipient_id"}, default="")
-    errors: WhatsappErrors = ib(metadata={"json": "errors"}, default={})
+    errors: Optional[WhatsappErrors] = ib(metadata={"json": "errors"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
-        error_obj = None
-
-        try:
-            error_obj = data.get("errors", [])[0]
-        except IndexError:
-            error_obj = {}
+        errors = data.get("errors")
+        error_obj = errors[0] if errors else {}
 
         return cls(
             id=data.get("id", ""),
@@ -362,8 +324,8 @@ class WhatsappStatusesEvent(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappContext(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappContext:
     """
     Contains the information from the reply message.
 
@@ -384,8 +346,21 @@ class WhatsappContext(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappMessages(SerializableAttrs):
+# The builder of the content of each type of message, by type
+_MESSAGE_CONTENT_BUILDERS = {
+    "text": lambda text: text.get("body", ""),
+    "image": WhatsappMedia.from_dict,
+    "video": WhatsappMedia.from_dict,
+    "audio": WhatsappAudio.from_dict,
+    "sticker": WhatsappSticker.from_dict,
+    "document": WhatsappDocument.from_dict,
+    "interactive": InteractiveMessage.from_dict,
+    "button": ButtonMessage.from_dict,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class WhatsappMessages:
     """
     Contain the information of the message.
 
@@ -396,7 +371,7 @@ class WhatsappMessages(SerializableAttrs):
 
     - timestamp: The time when the message was sent.
 
-    - text: Containt message of the user.
+    - text: The text of the message of the user.
 
     - type: The type of the message.
 
@@ -422,74 +397,59 @@ class WhatsappMessages(SerializableAttrs):
     from_number: str = ib(metadata={"json": "from"}, default="")
     id: WhatsappMessageID = ib(metadata={"json": "id"}, default="")
     timestamp: str = ib(metadata={"json": "timestamp"}, default="")
-    context: WhatsappContext = ib(metadata={"json": "context"}, default={})
-    text: WhatsappText = ib(metadata={"json": "text"}, default={})
+    context: Optional[WhatsappContext] = ib(metadata={"json": "context"}, default=None)
+    text: str = ib(metadata={"json": "text"}, default="")
     type: str = ib(metadata={"json": "type"}, default="")
-    image: WhatsappImage = ib(metadata={"json": "image"}, default={})
-    video: WhatsappVideo = ib(metadata={"json": "video"}, default={})
-    audio: WhatsappAudio = ib(metadata={"json": "audio"}, default={})
-    sticker: WhatsappSticker = ib(metadata={"json": "sticker"}, default={})
-    document: WhatsappDocument = ib(metadata={"json": "document"}, default={})
-    location: WhatsappLocation = ib(metadata={"json": "location"}, default={})
-    reaction: WhatsappReaction = ib(metadata={"json": "reaction"}, default={})
-    interactive: InteractiveMessage = ib(metadata={"json": "interactive"}, default={})
-    button: ButtonMessage = ib(metadata={"json": "button"}, default={})
+    image: Optional[WhatsappMedia] = ib(metadata={"json": "image"}, default=None)
+    video: Optional[WhatsappMedia] = ib(metadata={"json": "video"}, default=None)
+    audio: Optional[WhatsappAudio] = ib(metadata={"json": "audio"}, default=None)
+    sticker: Optional[WhatsappSticker] = ib(metadata={"json": "sticker"}, default=None)
+    document: Optional[WhatsappDocument] = ib(metadata={"json": "document"}, default=None)
+    location: Optional[WhatsappLocation] = ib(metadata={"json": "location"}, default=None)
+    reaction: Optional[WhatsappReaction] = ib(metadata={"json": "reaction"}, default=None)
+    interactive: Optional[InteractiveMessage] = ib(metadata={"json": "interactive"}, default=None)
+    button: Optional[ButtonMessage] = ib(metadata={"json": "button"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
         context_obj = None
-        text_obj = None
-        image_obj = None
-        video_obj = None
-        audio_obj = None
-        sticker_obj = None
-        document_obj = None
-        interactive_obj = None
-        button_obj = None
-
-        if data.get("context", {}):
-            context_obj = WhatsappContext.from_dict(data.get("context", {}))
-
-        if data.get("text", ""):
-            text_obj = WhatsappText(**data.get("text", {}))
-
-        elif data.get("image", ""):
-            image_obj = WhatsappImage.from_dict(data.get("image", {}))
-
-        elif data.get("video", ""):
-            video_obj = WhatsappVideo.from_dict(data.get("video", {}))
-
-        elif data.get("audio", ""):
-            audio_obj = WhatsappAudio.from_dict(data.get("audio", {}))
-
-        elif data.get("sticker", ""):
-            sticker_obj = WhatsappSticker.from_dict(data.get("sticker", {}))
-
-        elif data.get("document", ""):
-            document_obj = WhatsappDocument.from_dict(data.get("document", {}))
-
-        elif data.get("interactive", ""):
-            interactive_obj = InteractiveMessage.from_dict(data.get("interactive", {}))
-
-        elif data.get("button", ""):
-            button_obj = ButtonMessage.from_dict(data.get("button", {}))
+        location_obj = _EMPTY_LOCATION
+        reaction_obj = _EMPTY_REACTION
+        message_type = data.get("type", "")
+
+        if context := data.get("context"):
+            context_obj = WhatsappContext.from_dict(context)
+
+        if location := data.get("location"):
+            location_obj = WhatsappLocation(
+                address=location.get("address", ""),
+                latitude=location.get("latitude", ""),
+                longitude=location.get("longitude", ""),
+                name=location.get("name", ""),
+                url=location.get("url", ""),
+            )
+
+        if reaction := data.get("reaction"):
+            reaction_obj = WhatsappReaction(
+                message_id=reaction.get("message_id", ""), emoji=reaction.get("emoji", "")
+            )
+
+        # The content of the message is sent under the key of its type, which is also the name of
+        # the field that stores it, the other content fields keep their defaults
+        contents = {}
+        build_content = _MESSAGE_CONTENT_BUILDERS.get(message_type)
+        if build_content and (content := data.get(message_type)):
+            contents[message_type] = build_content(content)
 
         return cls(
             from_number=data.get("from", ""),
             id=data.get("id", ""),
             timestamp=data.get("timestamp", ""),
             context=context_obj,
-            text=text_obj,
-            type=data.get("type", ""),
-            image=image_obj,
-            video=video_obj,
-            audio=audio_obj,
-            sticker=sticker_obj,
-            document=document_obj,
-            location=WhatsappLocation(**data.get("location", {})),
-            reaction=WhatsappReaction(**data.get("reaction", {})),
-            interactive=interactive_obj,
-            button=button_obj,
+            type=message_type,
+            location=location_obj,
+            reaction=reaction_obj,
+            **contents,
         )
 
 
@@ -514,15 +474,15 @@ class WhatsappContacts(SerializableAttrs):
     - wa_id: The number of the user.
     """
 
-    profile: WhatsappProfile = ib(metadata={"json": "profile"}, default={})
+    profile: Optional[WhatsappProfile] = ib(metadata={"json": "profile"}, default=None)
     wa_id: WhatsappPhone = ib(metadata={"json": "wa_id"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
         profile_obj = None
 
-        if data.get("profile", {}):
-            profile_obj = WhatsappProfile(**data.get("profile", {}))
+        if profile := data.get("profile"):
+            profile_obj = WhatsappProfile(name=profile.get("name", ""))
 
         return cls(
             profile=profile_obj,
@@ -530,8 +490,14 @@ class WhatsappContacts(SerializableAttrs):
         )
 
 
-@dataclass
-class WhatsappMetaData(SerializableAttrs):
+# Shared instances used when the value of an event does not carry messages or statuses, which their
+# frozen classes make safe
+_EMPTY_MESSAGES = WhatsappMessages.from_dict({})
+_EMPTY_STATUSES = WhatsappStatusesEvent.from_dict({})
+
+
+@dataclass(slots=True, frozen=True)
+class WhatsappMetaData:
     """
     Contain the information of the whatsapp business account.
 
@@ -544,8 +510,8 @@ class WhatsappMetaData(SerializableAttrs):
     phone_number_id: WSPhoneID = ib(metadata={"json": "phone_number_id"}, default="")
 
 
-@dataclass
-class WhatsappValue(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappValue:
     """
     Contain the information of the message, the user and the business account.
 
@@ -560,10 +526,10 @@ class WhatsappValue(SerializableAttrs):
     """
 
     messaging_product: str = ib(metadata={"json": "messaging_product"}, default="")
-    metadata: WhatsappMetaData = ib(metadata={"json": "metadata"}, default={})
-    contacts: WhatsappContacts = ib(metadata={"json": "contacts"}, default={})
-    messages: WhatsappMessages = ib(metadata={"json": "messages"}, default={})
-    statuses: WhatsappStatusesEvent = ib(metadata={"json": "statuses"}, default={})
+    metadata: Optional[WhatsappMetaData] = ib(metadata={"json": "metadata"}, default=None)
+    contacts: Optional[WhatsappContacts] = ib(metadata={"json": "contacts"}, default=None)
+    messages: Optional[WhatsappMessages] = ib(metadata={"json": "messages"}, default=None)
+    statuses: Optional[WhatsappStatusesEvent] = ib(metadata={"json": "statuses"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -572,35 +538,37 @@ class WhatsappValue(SerializableAttrs):
         messages_obj = None
         statuses_obj = None
 
-        if data.get("metadata"):
-            metadata_obj = WhatsappMetaData(**data.get("metadata", {}))
+        if metadata := data.get("metadata"):
+            metadata_obj = WhatsappMetaData(
+                display_phone_number=metadata.get("display_phone_number", ""),
+                phone_number_id=metadata.get("phone_number_id", ""),
+            )
 
-        try:
-            contacts_obj = data.get("contacts", [])[0]
-        except IndexError:
-            contacts_obj = {}
+        # A message event has no statuses and a status event has no contacts nor messages, the
+        # missing messages and statuses are the shared empty objects. The contacts can be modified,
+        # so they are always a new object.
+        contacts = data.get("contacts")
+        contacts_obj = WhatsappContacts.from_dict(contacts[0] if contacts else {})
 
-        try:
-            messages_obj = data.get("messages", [])[0]
-        except IndexError:
-            messages_obj = {}
+        messages = data.get("messages")
+        messages_obj = WhatsappMessages.from_dict(messages[0]) if messages else _EMPTY_MESSAGES
 
-        try:
-            statuses_obj = data.get("statuses", [])[0]
-        except IndexError:
-            statuses_obj = {}
+        statuses = data.get("statuses")
+        statuses_obj = (
+            WhatsappStatusesEvent.from_dict(statuses[0]) if statuses else _EMPTY_STATUSES
+        )
 
         return cls(
             messaging_product=data.get("messaging_product", ""),
             metadata=metadata_obj,
-            contacts=WhatsappContacts.from_dict(contacts_obj),
-            messages=WhatsappMessages.from_dict(messages_obj),
-            statuses=WhatsappStatusesEvent.from_dict(statuses_obj),
+            contacts=contacts_obj,
+            messages=messages_obj,
+            statuses=statuses_obj,
         )
 
 
-@dataclass
-class WhatsappChanges(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappChanges:
     """
     Contain relevant information of the message.
 
@@ -609,21 +577,17 @@ class WhatsappChanges(SerializableAttrs):
     - field: The type of the information.
     """
 
-    value: WhatsappValue = ib(metadata={"json": "value"}, default={})
+    value: Optional[WhatsappValue] = ib(metadata={"json": "value"}, default=None)
     field: str = ib(metadata={"json": "field"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
-        value_obj = data.get("value", {})
-
-        return cls(
-            value=WhatsappValue.from_dict(value_obj),
-            field=data.get("field", ""),
-        )
+        # Kept for backward compatibility, the changes are parsed by WhatsappEvent.from_dict
+        return WhatsappEvent.from_dict({"entry": [{"changes": [data]}]}).entry.changes
 
 
-@dataclass
-class WhatsappEventEntry(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappEventEntry:
     """
     Contain relevant information of the request.
 
@@ -633,23 +597,16 @@ class WhatsappEventEntry(SerializableAttrs):
     """
 
     id: WsBusinessID = ib(metadata={"json": "id"})
-    changes: WhatsappChanges = ib(metadata={"json": "changes"}, default={})
+    changes: Optional[WhatsappChanges] = ib(metadata={"json": "changes"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
-        try:
-            changes_obj = data.get("changes", [])[0]
-        except IndexError:
-            changes_obj = {}
-
-        return cls(
-            id=data.get("id", ""),
-            changes=WhatsappChanges.from_dict(changes_obj),
-        )
+        # Kept for backward compatibility, the entry is parsed by WhatsappEvent.from_dict
+        return WhatsappEvent.from_dict({"entry": [data]}).entry
 
 
-@dataclass
-class WhatsappEvent(SerializableAttrs):
+@dataclass(slots=True, frozen=True)
+class WhatsappEvent:
     """
     Contain the data of the request.
 
@@ -659,23 +616,32 @@ class WhatsappEvent(SerializableAttrs):
     """
 
     object: str = ib(metadata={"json": "object"})
-    entry: WhatsappEventEntry = ib(metadata={"json": "entry"}, default={})
+    entry: Optional[WhatsappEventEntry] = ib(metadata={"json": "entry"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
-        try:
-            entry_obj = data.get("entry", [])[0]
-        except IndexError:
-            entry_obj = {}
+        # The entry and the changes are only wrappers around the value, so they are unpacked here
+        # instead of going through WhatsappEventEntry.from_dict and WhatsappChanges.from_dict
+        entry = data.get("entry")
+        entry_obj = entry[0] if entry else {}
+
+        changes = entry_obj.get("changes")
+        changes_obj = changes[0] if changes else {}
 
         return cls(
-            object=data.get("object"),
-            entry=WhatsappEventEntry.from_dict(entry_obj),
+            object=data.get("object", ""),
+            entry=WhatsappEventEntry(
+                id=entry_obj.get("id", ""),
+                changes=WhatsappChanges(
+                    value=WhatsappValue.from_dict(changes_obj.get("value") or {}),
+                    field=changes_obj.get("field", ""),
+                ),
+            ),
         )
 
 
-@dataclass
-class WhatsappMediaData(SerializableAttrs):
+@dataclass(slots=True)
+class WhatsappMediaData:
     """
     Contain the data of the media.
 
@@ -692,12 +658,12 @@ class WhatsappMediaData(SerializableAttrs):
     - file_size: The size of the media.
     """
 
-    id: str = ib(metadata={"json": "id"})
-    messaging_product: str = ib(metadata={"json": "messaging_product"})
-    url: str = ib(metadata={"json": "url"})
-    mime_type: str = ib(metadata={"json": "mime_type"})
-    hash: str = ib(metadata={"json": "sha256"})
-    file_size: int = ib(metadata={"json": "file_size"})
+    id: str = ib(metadata={"json": "id"}, default="")
+    messaging_product: str = ib(metadata={"json": "messaging_product"}, default="")
+    url: str = ib(metadata={"json": "url"}, default="")
+    mime_type: str = ib(metadata={"json": "mime_type"}, default="")
+    hash: str = ib(metadata={"json": "sha256"}, default="")
+    file_size: int = ib(metadata={"json": "file_size"}, default=0)
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -707,5 +673,5 @@ class WhatsappMediaData(SerializableAttrs):
             url=data.get("url", ""),
             mime_type=data.get("mime_type", ""),
             hash=data.get("sha256", ""),
-            file_size=data.get("file_size", ""),
+            file_size=data.get("file_size", 0),
         )
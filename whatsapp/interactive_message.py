@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from attr import dataclass, ib
 from mautrix.types import SerializableAttrs
@@ -20,6 +20,14 @@ class RowSection(SerializableAttrs):
     title: str = ib(metadata={"json": "title"}, default="")
     description: str = ib(metadata={"json": "description"}, default="")
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data.get("id", ""),
+            title=data.get("title", ""),
+            description=data.get("description", ""),
+        )
+
 
 @dataclass
 class SectionsQuickReply(SerializableAttrs):
@@ -32,14 +40,14 @@ class SectionsQuickReply(SerializableAttrs):
     """
 
     title: str = ib(metadata={"json": "title"}, default="")
-    rows: List[RowSection] = ib(factory=List, metadata={"json": "rows"})
+    rows: List[RowSection] = ib(factory=list, metadata={"json": "rows"})
 
     @classmethod
     def from_dict(cls, data: dict):
         row_obj = None
 
-        if data.get("rows", []):
-            row_obj = [RowSection(**row.__dict__) for row in data.get("rows", [])]
+        if rows := data.get("rows"):
+            row_obj = [RowSection.from_dict(row) for row in rows]
 
         return cls(
             title=data.get("title", ""),
@@ -61,6 +69,13 @@ class ReplyButton(SerializableAttrs):
     id: str = ib(metadata={"json": "id"}, default="")
     title: str = ib(metadata={"json": "title"}, default="")
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data.get("id", ""),
+            title=data.get("title", ""),
+        )
+
 
 @dataclass
 class ButtonsQuickReply(SerializableAttrs):
@@ -73,13 +88,15 @@ class ButtonsQuickReply(SerializableAttrs):
 
     """
 
-    reply: ReplyButton = ib(metadata={"json": "reply"}, default={})
+    reply: Optional[ReplyButton] = ib(metadata={"json": "reply"}, default=None)
     type: str = ib(metadata={"json": "type"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
+        reply = data.get("reply")
+
         return cls(
-            reply=ReplyButton(**data.get("reply", {})),
+            reply=ReplyButton.from_dict(reply) if reply else None,
             type=data.get("type", ""),
         )
 
@@ -100,23 +117,19 @@ class ActionQuickReply(SerializableAttrs):
 
     name: str = ib(metadata={"json": "name"}, default="")
     button: str = ib(metadata={"json": "button"}, default="")
-    buttons: List[ButtonsQuickReply] = ib(factory=List, metadata={"json": "buttons"})
-    sections: List[SectionsQuickReply] = ib(factory=List, metadata={"json": "sections"})
+    buttons: List[ButtonsQuickReply] = ib(factory=list, metadata={"json": "buttons"})
+    sections: List[SectionsQuickReply] = ib(factory=list, metadata={"json": "sections"})
 
     @classmethod
     def from_dict(cls, data: dict):
         button_obj = None
         section_obj = None
 
-        if data.get("buttons", []):
-            button_obj = [
-                ButtonsQuickReply(**button.__dict__) for button in data.get("buttons", [])
-            ]
+        if buttons := data.get("buttons"):
+            button_obj = [ButtonsQuickReply.from_dict(button) for button in buttons]
 
-        if data.get("sections", []):
-            section_obj = [
-                SectionsQuickReply(**section.__dict__) for section in data.get("sections", [])
-            ]
+        if sections := data.get("sections"):
+            section_obj = [SectionsQuickReply.from_dict(section) for section in sections]
 
         return cls(
             name=data.get("name", ""),
@@ -195,18 +208,32 @@ class HeaderQuickReply(SerializableAttrs):
 
     type: str = ib(metadata={"json": "type"}, default="")
     text: str = ib(metadata={"json": "text"}, default="")
-    image: MediaQuickReply = ib(metadata={"json": "image"}, default={})
-    video: MediaQuickReply = ib(metadata={"json": "video"}, default={})
-    document: DocumentQuickReply = ib(metadata={"json": "document"}, default={})
+    image: Optional[MediaQuickReply] = ib(metadata={"json": "image"}, default=None)
+    video: Optional[MediaQuickReply] = ib(metadata={"json": "video"}, default=None)
+    document: Optional[DocumentQuickReply] = ib(metadata={"json": "document"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
+        image_obj = None
+        video_obj = None
+        document_obj = None
+
+        # The header only carries the media of its type
+        if image := data.get("image"):
+            image_obj = MediaQuickReply.from_dict(image)
+
+        if video := data.get("video"):
+            video_obj = MediaQuickReply.from_dict(video)
+
+        if document := data.get("document"):
+            document_obj = DocumentQuickReply.from_dict(document)
+
         return cls(
             type=data.get("type", ""),
             text=data.get("text", ""),
-            video=MediaQuickReply.from_dict(data.get("video", {})),
-            document=DocumentQuickReply.from_dict(data.get("document", {})),
-            image=MediaQuickReply.from_dict(data.get("image", {})),
+            video=video_obj,
+            document=document_obj,
+            image=image_obj,
         )
 
 
@@ -228,10 +255,10 @@ class InteractiveMessage(SerializableAttrs):
     """
 
     type: str = ib(metadata={"json": "type"}, default="")
-    header: HeaderQuickReply = ib(metadata={"json": "header"}, default={})
-    body: TextReply = ib(metadata={"json": "body"}, default={})
-    footer: TextReply = ib(metadata={"json": "footer"}, default={})
-    action: ActionQuickReply = ib(metadata={"json": "action"}, default={})
+    header: Optional[HeaderQuickReply] = ib(metadata={"json": "header"}, default=None)
+    body: Optional[TextReply] = ib(metadata={"json": "body"}, default=None)
+    footer: Optional[TextReply] = ib(metadata={"json": "footer"}, default=None)
+    action: Optional[ActionQuickReply] = ib(metadata={"json": "action"}, default=None)
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -240,17 +267,17 @@ class InteractiveMessage(SerializableAttrs):
         body_obj = None
         footer_obj = None
 
-        if data.get("header", {}):
-            header_obj = HeaderQuickReply.from_dict(data.get("header", {}))
+        if header := data.get("header"):
+            header_obj = HeaderQuickReply.from_dict(header)
 
-        if data.get("action", []):
-            action_obj = ActionQuickReply.from_dict(data.get("action", {}))
+        if action := data.get("action"):
+            action_obj = ActionQuickReply.from_dict(action)
 
-        if data.get("body", {}):
-            body_obj = TextReply.from_dict(data.get("body", {}))
+        if body := data.get("body"):
+            body_obj = TextReply.from_dict(body)
 
-        if data.get("footer", {}):
-            footer_obj = TextReply.from_dict(data.get("footer", {}))
+        if footer := data.get("footer"):
+            footer_obj = TextReply.from_dict(footer)
 
         return cls(
             type=data.get("type", ""),
@@ -260,31 +287,41 @@ class InteractiveMessage(SerializableAttrs):
             action=action_obj,
         )
 
+    def _heading(self) -> str:
+        """
+        Obtain the text of the header, the body and the footer, that starts the message text.
+        """
+        header = self.header
+        body = self.body
+        footer = self.footer
+        return f"""{header.text if header else ''}
+            {body.text if body else ''}
+            {footer.text if footer else ''}
+        """
+
     def button_message(self, button_item_format: str) -> str:
         """
         Obtain a message text with the information of the interactive quick reply message.
         """
-        msg = f"""{self.header.text if self.header else ''}
-            {self.body.text  if self.body else ''}
-            {self.footer.text  if self.footer else ''}
-        """
+        msg = self._heading()
         message: str = button_item_format or ""
-        for index, button in enumerate(self.action.buttons, start=1):
-            msg += message.format(index=index, title=button.reply.title, id=button.reply.id)
-        return msg
+        return msg + "".join(
+            [
+                message.format(index=index, title=button.reply.title, id=button.reply.id)
+                for index, button in enumerate(self.action.buttons or (), start=1)
+                if button.reply
+            ]
+        )
 
     def list_message(self, list_item_format: str) -> str:
         """
         Obtain a message text with the information of the interactive list message.
         """
-        msg = f"""{self.header.text if self.header else ''}
-            {self.body.text  if self.body else ''}
-            {self.footer.text  if self.footer else ''}
-        """
+        msg = self._heading()
         message: str = list_item_format or ""
-        for section_index, section in enumerate(self.action.sections, start=1):
-            for row_index, row in enumerate(section.rows, start=1):
-                msg += message.format(
+        return msg + "".join(
+            [
+                message.format(
                     section_title=section.title,
                     section_index=section_index,
                     row_title=row.title,
@@ -292,7 +329,10 @@ class InteractiveMessage(SerializableAttrs):
                     row_id=row.id,
                     row_index=row_index,
                 )
-        return msg
+                for section_index, section in enumerate(self.action.sections or (), start=1)
+                for row_index, row in enumerate(section.rows or (), start=1)
+            ]
+        )
 
 
 @dataclass
@@ -308,20 +348,17 @@ class EventInteractiveMessage(SerializableAttrs):
     """
 
     body: str = ib(metadata={"json": "body"}, default="")
-    interactive_message: InteractiveMessage = ib(
-        metadata={"json": "interactive_message"}, default={}
+    interactive_message: Optional[InteractiveMessage] = ib(
+        metadata={"json": "interactive_message"}, default=None
     )
     msgtype: str = ib(metadata={"json": "msgtype"}, default="")
 
     @classmethod
     def from_dict(cls, data: dict):
         interactive_message_obj = None
-        interactive_message = InteractiveMessage
 
-        if data.get("interactive_message", {}):
-            interactive_message_obj = interactive_message.from_dict(
-                data.get("interactive_message", {})
-            )
+        if interactive_message := data.get("interactive_message"):
+            interactive_message_obj = InteractiveMessage.from_dict(interactive_message)
 
         return cls(
             body=data.get("body", ""),
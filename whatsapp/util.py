@@ -0,0 +1,4 @@
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
@@ -10,6 +10,7 @@ from whatsapp_matrix.portal import Portal
 from whatsapp_matrix.user import User
 
 from .data import WhatsappEvent, WhatsappStatusesEvent
+from .util import json_loads
 
 
 class WhatsappHandler:
@@ -74,12 +75,18 @@ class WhatsappHandler:
         """It receives a request from Whatsapp, checks if the app is valid,
         and then calls the appropriate function to handle the event
         """
-        data = dict(**await request.json())
+        data = await request.json(loads=json_loads)
         self.log.debug(f"The event arrives {data}")
 
         # Get the business id and the value of the event
-        wb_business_id = data.get("entry")[0].get("id")
-        wb_value = data.get("entry")[0].get("changes")[0].get("value")
+        entry = data.get("entry")
+        wb_entry = entry[0] if entry else {}
+        wb_business_id = wb_entry.get("id")
+        changes = wb_entry.get("changes")
+        wb_changes = changes[0] if changes else {}
+        wb_value = wb_changes.get("value") or {}
+        statuses = wb_value.get("statuses")
+        wb_status = statuses[0] if statuses else {}
         # Get all the whatsapp apps
         wb_apps = await DBWhatsappApplication.get_all_wb_apps()
 
@@ -96,16 +103,16 @@ class WhatsappHandler:
             return await self.message_event(WhatsappEvent.from_dict(data))
 
         # If the event is a read, we send a read event to matrix
-        elif wb_value.get("statuses")[0].get("status") == "read":
+        elif wb_status.get("status") == "read":
             return await self.read_event(WhatsappEvent.from_dict(data))
 
         # If the event is an error, we send to the user the message error
-        elif wb_value.get("statuses")[0].get("status") == "failed":
-            wb_statuses = WhatsappStatusesEvent.from_dict(wb_value.get("statuses")[0])
+        elif wb_status.get("status") == "failed":
+            wb_statuses = WhatsappStatusesEvent.from_dict(wb_status)
             # Get the customer phone
             customer_phone = wb_statuses.recipient_id
             # Get the error information
-            message_error = wb_statuses.errors.error_data.details
+            message_error = wb_statuses.errors.details
 
             portal: Portal = await Portal.get_by_app_and_phone_id(
                 phone_id=customer_phone, app_business_id=wb_business_id, create=False
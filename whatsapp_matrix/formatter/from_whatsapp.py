@@ -144,9 +144,17 @@ def create_text_body(event: MessageEvent) -> MessageEvent:
     -----------
     event: MessageEvent - MessageEvent
     """
-    message = InteractiveMessage.from_dict(event.content.get("interactive_message", {}))
-
-    body = message.button_message if message.type == "button" else message.list_message
+    message = InteractiveMessage.from_dict(event.content.get("interactive_message") or {})
+
+    # The item templates are the same ones that the portal uses to send the message to Matrix
+    if message.type == "button":
+        body = message.button_message(
+            button_item_format=Puppet.config["bridge.interactive_messages.button_message"]
+        )
+    else:
+        body = message.list_message(
+            list_item_format=Puppet.config["bridge.interactive_messages.list_message"]
+        )
 
     event.content = TextMessageEventContent(
         body=body,
@@ -396,7 +396,7 @@ class Portal(DBPortal, BasePortal):
         # Validate what kind of message is and obtain the id of the message
         if whatsapp_message_type == "text":
             message_type = MessageType.TEXT
-            attachment = message_data.text.body
+            attachment = message_data.text
 
         elif whatsapp_message_type == "image":
             message_type = MessageType.IMAGE
@@ -1134,17 +1134,19 @@ class Portal(DBPortal, BasePortal):
 
         if header_type and header_type in ("image", "document", "video"):
             file_name = ""
-            # Validate the type of the header media of the interactive message to send it to Matrix
+            header = event_interactive_message.interactive_message.header
+            # Validate the type of the header media of the interactive message to send it to Matrix,
+            # the header may not carry the media of its type
             if header_type == "image":
                 message_type = MessageType.IMAGE
-                url = event_interactive_message.interactive_message.header.image.link
+                url = header.image.link if header.image else ""
             elif header_type == "document":
                 message_type = MessageType.FILE
-                url = event_interactive_message.interactive_message.header.document.link
-                file_name = event_interactive_message.interactive_message.header.document.filename
+                url = header.document.link if header.document else ""
+                file_name = header.document.filename if header.document else ""
             elif header_type == "video":
                 message_type = MessageType.VIDEO
-                url = event_interactive_message.interactive_message.header.video.link
+                url = header.video.link if header.video else ""
 
             if not url:
                 self.log.error(